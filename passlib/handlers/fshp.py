@@ -5,12 +5,12 @@
 # imports
 #=============================================================================
 # core
-from base64 import b64encode, b64decode
 import re
 import logging; log = logging.getLogger(__name__)
 # site
 # pkg
 from passlib.utils import to_unicode
+from passlib.utils.binary import b64encode, b64decode
 import passlib.utils.handlers as uh
 from passlib.utils.compat import bascii_to_str, iteritems, u,\
                                  unicode
@@ -68,7 +68,7 @@ class fshp(uh.HasRounds, uh.HasRawSalt, uh.HasRawChecksum, uh.GenericHandler):
     setting_kwds = ("salt", "salt_size", "rounds", "variant")
     checksum_chars = uh.PADDED_BASE64_CHARS
     ident = u("{FSHP")
-    # checksum_size is property() that depends on variant
+    # checksum_size is set by __init__, since it depends on variant
 
     #--HasRawSalt--
     default_salt_size = 16 # current passlib default, FSHP uses 8
@@ -110,6 +110,7 @@ class fshp(uh.HasRounds, uh.HasRawSalt, uh.HasRawChecksum, uh.GenericHandler):
     # instance attrs
     #===================================================================
     variant = None
+    checksum_alg = None # set by __init__, from _variant_info
 
     #===================================================================
     # init
@@ -125,10 +126,16 @@ class fshp(uh.HasRounds, uh.HasRawSalt, uh.HasRawChecksum, uh.GenericHandler):
         else:
             raise TypeError("no variant specified")
         self.variant = variant
+        # NOTE: resolving these once here, rather than via properties,
+        #       since they're consulted repeatedly by _norm_checksum(), _calc_checksum(), etc.
+        self.checksum_alg, self.checksum_size = self._variant_info[variant]
         super(fshp, self).__init__(**kwds)
 
     @classmethod
     def _norm_variant(cls, variant):
+        # fast path for common case (e.g. from_string) of an already-valid int
+        if isinstance(variant, int) and variant in cls._variant_info:
+            return variant
         if isinstance(variant, bytes):
             variant = variant.decode("ascii")
         if isinstance(variant, unicode):
@@ -142,14 +149,6 @@ class fshp(uh.HasRounds, uh.HasRawSalt, uh.HasRawChecksum, uh.GenericHandler):
             raise ValueError("invalid fshp variant")
         return variant
 
-    @property
-    def checksum_alg(self):
-        return self._variant_info[self.variant][0]
-
-    @property
-    def checksum_size(self):
-        return self._variant_info[self.variant][1]
-
     #===================================================================
     # formatting
     #===================================================================
@@ -192,8 +191,8 @@ class fshp(uh.HasRounds, uh.HasRawSalt, uh.HasRawChecksum, uh.GenericHandler):
     #===================================================================
 
     def _calc_checksum(self, secret):
-        if isinstance(secret, unicode):
-            secret = secret.encode("utf-8")
+        # NOTE: not encoding unicode secrets here, pbkdf1() already
+        #       normalizes its inputs to bytes using utf-8.
         # NOTE: for some reason, FSHP uses pbkdf1 with password & salt reversed.
         #       this has only a minimal impact on security,
         #       but it is worth noting this deviation.
@@ -4,7 +4,6 @@
 # imports
 #=============================================================================
 # core
-from base64 import b64encode, b64decode
 from hashlib import md5, sha1
 import logging; log = logging.getLogger(__name__)
 import re
@@ -14,6 +13,7 @@ from passlib.handlers.misc import plaintext
 from passlib.utils import unix_crypt_schemes, to_unicode
 from passlib.utils.compat import uascii_to_str, unicode, u
 from passlib.utils.decor import classproperty
+from passlib.utils.binary import b64encode, b64decode
 import passlib.utils.handlers as uh
 # local
 __all__ = [
@@ -235,7 +235,11 @@ class ldap_plaintext(plaintext):
     def identify(cls, hash):
         # NOTE: identifies all strings EXCEPT those with {XXX} prefix
         hash = uh.to_unicode_for_identify(hash)
-        return bool(hash) and cls._2307_pat.match(hash) is None
+        if not hash:
+            return False
+        # NOTE: regex can only match if hash starts with "{", so skip it otherwise;
+        #       saves a regex call per verify when this is a context's fallback scheme.
+        return not hash.startswith(u("{")) or cls._2307_pat.match(hash) is None
 
 #=============================================================================
 # {CRYPT} wrappers
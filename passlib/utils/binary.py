@@ -7,8 +7,6 @@ passlib.utils.binary - binary data encoding/decoding/manipulation
 # core
 from __future__ import absolute_import, division, print_function
 from base64 import (
-    b64encode,
-    b64decode,
     b32decode as _b32decode,
     b32encode as _b32encode,
 )
@@ -16,6 +14,11 @@ from binascii import b2a_base64, a2b_base64, Error as _BinAsciiError
 import logging
 log = logging.getLogger(__name__)
 # site
+try:
+    # https://pypi.python.org/pypi/pybase64/ -- drop-in SIMD-accelerated base64 codec
+    from pybase64 import b64encode, b64decode
+except ImportError:
+    from base64 import b64encode, b64decode
 # pkg
 from passlib import exc
 from passlib.utils.compat import (